@@ -17,9 +17,7 @@ USAGE:
   # Before running, make sure to open the target URL in Google Chrome!
 
 COMMON EXAMPLES:
-  web-llm-interactor ask "What is the capital of Georgia?"
-  web-llm-interactor ask "Who is the CEO of Apple?" --url "https://chat.perplexity.ai/" --output-html "./perplexity_response.html"
-  web-llm-interactor ask "What is the capital of Florida?" --all
+  web-llm-interactor usage  # Show example commands
 
 DEVELOPMENT MODE (not for end users):
   python -m web_llm_interactor.cli ask "Your question"
@@ -38,6 +36,13 @@ from web_llm_interactor.file_utils import generate_html_filename
 DEFAULT_SCRIPT_PATH = Path(__file__).parent / "send_enter_save_source.applescript"
 DEFAULT_HTML_PATH = Path("output.html").resolve()
 DEFAULT_URL = "https://chat.qwen.ai/"
+RETRY_BASE_DELAY = 1  # Seconds before the first retry; doubles on each attempt
+RETRY_MAX_DELAY = 8
+
+EXAMPLES = """  web-llm-interactor ask "What is the capital of Georgia?"
+  web-llm-interactor ask "Who is the CEO of Apple?" --url "https://chat.perplexity.ai/" --output-html "./perplexity_response.html"
+  web-llm-interactor ask "What is the capital of Florida?" --all
+"""
 
 app = typer.Typer(
     help="""
@@ -51,16 +56,10 @@ USAGE:
   web-llm-interactor ask "Your question here"  # Basic usage (uses Qwen by default)
 
 Examples:
-  web-llm-interactor ask "What is the capital of Georgia?"
-  web-llm-interactor ask "Who is the CEO of Apple?" --url "https://chat.perplexity.ai/" --output-html "./perplexity_response.html"
-  web-llm-interactor ask "What is the capital of Florida?" --all
 """
+    + EXAMPLES,
 )
 
-DEFAULT_SCRIPT_PATH = Path(__file__).parent / "send_enter_save_source.applescript"
-DEFAULT_HTML_PATH = Path("output.html").resolve()
-DEFAULT_URL = "https://chat.qwen.ai/"
-
 
 @app.command(
     help="Send a message to a web LLM chat page and extract the JSON response."
@@ -126,31 +125,32 @@ def ask(
         typer.echo(f"Added JSON format instructions. Fields: {required_fields}")
     
     typer.echo(f"Sending: {formatted_question}")
+
+    # Environment and arguments are the same for every attempt, so build them once
+    env = os.environ.copy()
+    env["RESPONSE_WAIT_TIME"] = str(timeout)
+    env["POLL_INTERVAL"] = str(poll_interval)
+    env["REQUIRED_STABLE_POLLS"] = str(stable_polls)
+
+    if selector:
+        env["CHAT_INPUT_SELECTOR"] = selector
+
+    args = [
+        "osascript",
+        str(script_path),
+        formatted_question,
+        url,
+        str(Path(output_html).resolve()),
+    ]
+    if all:
+        args.append("--all")
+
+    # Add fields argument for extract_json_from_html.py
+    args.append("--fields")
+    args.append(required_fields)
+
     for attempt in range(max_attempts):
         try:
-            # Set environment variables for AppleScript
-            env = os.environ.copy()
-            env["RESPONSE_WAIT_TIME"] = str(timeout)
-            env["POLL_INTERVAL"] = str(poll_interval)
-            env["REQUIRED_STABLE_POLLS"] = str(stable_polls)
-            
-            if selector:
-                env["CHAT_INPUT_SELECTOR"] = selector
-            
-            args = [
-                "osascript",
-                str(script_path),
-                formatted_question,
-                url,
-                str(output_html),
-            ]
-            if all:
-                args.append("--all")
-            
-            # Add fields argument for extract_json_from_html.py
-            args.append("--fields")
-            args.append(required_fields)
-            
             typer.echo(f"Using HTML length polling: max wait={timeout}s, poll interval={poll_interval}s, stable polls={stable_polls}")
             
             result = subprocess.run(
@@ -172,7 +172,7 @@ def ask(
                 )
                 if attempt == max_attempts - 1:
                     raise typer.Exit(code=1)
-                time.sleep(2)
+                time.sleep(min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
                 continue
             typer.echo("Result from web LLM:")
             typer.echo(output)
@@ -195,6 +195,9 @@ def ask(
                 typer.secho(f"AppleScript Error: {error_msg}", fg=typer.colors.RED)
             if attempt == max_attempts - 1:
                 raise typer.Exit(code=1)
+            # A missing tab won't appear by waiting, so only back off for other errors
+            if "Could not find an open tab" not in error_msg:
+                time.sleep(min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
         except subprocess.TimeoutExpired:
             typer.secho(
                 f"Error: Timeout after {timeout}s. Retrying ({attempt + 1}/{max_attempts})..."
@@ -204,7 +207,7 @@ def ask(
             )
             if attempt == max_attempts - 1:
                 raise typer.Exit(code=1)
-            time.sleep(2)
+            time.sleep(min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
 
 
 @app.command("usage", help="Show usage examples for this CLI.")
@@ -212,12 +215,9 @@ def usage():
     """
     Show usage examples for web-llm-interactor.
     """
-    examples = """
+    examples = f"""
 Examples:
-  web-llm-interactor ask "What is the capital of Georgia?"
-  web-llm-interactor ask "Who is the CEO of Apple?" --url "https://chat.perplexity.ai/" --output-html "./perplexity_response.html"
-  web-llm-interactor ask "What is the capital of Florida?" --all
-  web-llm-interactor ask "Explain quantum computing" --fields "question,answer"
+{EXAMPLES}  web-llm-interactor ask "Explain quantum computing" --fields "question,answer"
   web-llm-interactor ask "What's the weather like in Paris?" --no-json-format
   web-llm-interactor ask "List the planets in our solar system" --timeout 45
   web-llm-interactor ask "How does photosynthesis work?" --selector "textarea.chat-input"
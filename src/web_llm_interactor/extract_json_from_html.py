@@ -9,18 +9,28 @@ import typer
 
 app = typer.Typer()
 
-# Configure loguru to ignore warnings (set level to INFO or higher)
-logger.remove()
-logger.add(
-    sys.stderr,  # Send logs to stderr so stdout is clean for JSON
-    level="INFO",
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    filter=lambda record: record["extra"].get("name") not in ["httpx", "websockets"]
-    and record["name"] != "json_utils",
-    backtrace=False,
-    diagnose=False,
-    colorize=True,
+# JSON-like objects inside <script> bodies, terminated by ';', '<' or ')'
+SCRIPT_JSON_RE = re.compile(
+    r"\{.*?\}(?=\s*;)|\{.*?\}(?=\s*<)|\{.*?\}(?=\s*\))", re.DOTALL
 )
+# Balanced objects up to three levels deep in text content
+TEXT_JSON_RE = re.compile(r"\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\}", re.DOTALL)
+
+
+def configure_logging():
+    """Configure loguru for command-line use (only called from __main__)."""
+    # Configure loguru to ignore warnings (set level to INFO or higher)
+    logger.remove()
+    logger.add(
+        sys.stderr,  # Send logs to stderr so stdout is clean for JSON
+        level="INFO",
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        filter=lambda record: record["extra"].get("name") not in ["httpx", "websockets"]
+        and record["name"] != "json_utils",
+        backtrace=False,
+        diagnose=False,
+        colorize=True,
+    )
 
 
 def is_valid_json_obj(json_obj, required_fields=["question", "thinking", "answer"]):
@@ -35,6 +45,29 @@ def is_valid_json_obj(json_obj, required_fields=["question", "thinking", "answer
     )
 
 
+def parse_valid_json(json_str, required_fields, source):
+    """Parse a candidate JSON string; return the object if it has the required fields, else None."""
+    try:
+        json_obj = clean_json_string(json_str, return_dict=True)
+    except (json.JSONDecodeError, TypeError):
+        logger.debug(f"Failed to parse JSON from {source}")
+        return None
+    if json_obj != {} and is_valid_json_obj(json_obj, required_fields):
+        return json_obj
+    logger.debug(f"JSON from {source} lacks required fields or has empty values")
+    return None
+
+
+def find_valid_json(pattern, text, required_fields, source):
+    """Return every match of the compiled pattern in text that parses to a valid JSON object."""
+    json_objects = []
+    for match in pattern.finditer(text):
+        json_obj = parse_valid_json(match.group(), required_fields, source)
+        if json_obj is not None:
+            json_objects.append(json_obj)
+    return json_objects
+
+
 def extract_json_from_html(
     html_content, required_fields=["question", "thinking", "answer"]
 ):
@@ -57,16 +90,13 @@ def extract_json_from_html(
         if code and code.string:
             text = code.string.strip()
             if "{" in text and "}" in text:
-                try:
-                    json_obj = clean_json_string(text, return_dict=True)
-                    if json_obj != {} and is_valid_json_obj(json_obj, required_fields):
-                        json_objects.append(json_obj)
-                        logger.debug("Extracted valid JSON from code block")
-                        # Return immediately if we find it in a code block since this is most likely
-                        # the intended JSON in the Qwen.ai context
-                        return json_objects
-                except json.JSONDecodeError:
-                    logger.debug("Failed to parse JSON from code block")
+                json_obj = parse_valid_json(text, required_fields, "code block")
+                if json_obj is not None:
+                    json_objects.append(json_obj)
+                    logger.debug("Extracted valid JSON from code block")
+                    # Return immediately if we find it in a code block since this is most likely
+                    # the intended JSON in the Qwen.ai context
+                    return json_objects
 
     # If no JSON found in code blocks, try the following methods:
     
@@ -77,21 +107,12 @@ def extract_json_from_html(
         script_content = script.string
         if script_content:
             # Look for JSON-like patterns
-            json_pattern = r"\{.*?\}(?=\s*;)|\{.*?\}(?=\s*<)|\{.*?\}(?=\s*\))"
-            matches = re.finditer(json_pattern, script_content, re.DOTALL)
-            for match in matches:
-                try:
-                    json_str = match.group()
-                    json_obj = clean_json_string(json_str, return_dict=True)
-                    if json_obj != {} and is_valid_json_obj(json_obj, required_fields):
-                        json_objects.append(json_obj)
-                        logger.debug("Extracted valid JSON from script tag")
-                    else:
-                        logger.debug(
-                            "JSON from script tag lacks required fields or has empty values"
-                        )
-                except json.JSONDecodeError:
-                    continue
+            found = find_valid_json(
+                SCRIPT_JSON_RE, script_content, required_fields, "script tag"
+            )
+            if found:
+                json_objects.extend(found)
+                logger.debug(f"Extracted {len(found)} valid JSON objects from script tag")
 
     # 2. Extract JSON from inline attributes (e.g., data- attributes)
     elements_with_data = soup.find_all(
@@ -101,20 +122,12 @@ def extract_json_from_html(
     for element in elements_with_data:
         for attr, value in element.attrs.items():
             if attr.startswith("data-"):
-                try:
-                    json_obj = clean_json_string(value, return_dict=True)
-                    if json_obj != {} and is_valid_json_obj(json_obj, required_fields):
-                        json_objects.append(json_obj)
-                        logger.debug(f"Extracted valid JSON from {attr} attribute")
-                    else:
-                        logger.debug(
-                            f"JSON from {attr} attribute lacks required fields or has empty values"
-                        )
-                except (json.JSONDecodeError, TypeError):
-                    continue
+                json_obj = parse_valid_json(value, required_fields, f"{attr} attribute")
+                if json_obj is not None:
+                    json_objects.append(json_obj)
+                    logger.debug(f"Extracted valid JSON from {attr} attribute")
 
     # 3. Extract JSON from text content of all elements - more aggressive pattern matching
-    json_pattern = r"\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\}"
     all_elements = soup.find_all(string=True)
     logger.debug(f"Found {len(all_elements)} text elements with potential JSON")
     
@@ -123,36 +136,20 @@ def extract_json_from_html(
         text = element.strip()
         has_all_fields = all(field in text for field in required_fields)
         if has_all_fields:
-            matches = re.finditer(json_pattern, text, re.DOTALL)
-            for match in matches:
-                try:
-                    json_str = match.group()
-                    json_obj = clean_json_string(json_str, return_dict=True)
-                    if json_obj != {} and is_valid_json_obj(json_obj, required_fields):
-                        json_objects.append(json_obj)
-                        logger.debug("Extracted valid JSON from text content with all fields")
-                except json.JSONDecodeError:
-                    continue
+            found = find_valid_json(TEXT_JSON_RE, text, required_fields, "text content")
+            if found:
+                json_objects.extend(found)
+                logger.debug(f"Extracted {len(found)} valid JSON objects from text content with all fields")
     
     # If we didn't find any JSON with all fields, try all elements
     if not json_objects:
         for element in all_elements:
             text = element.strip()
             if text and "{" in text and "}" in text:
-                matches = re.finditer(json_pattern, text, re.DOTALL)
-                for match in matches:
-                    try:
-                        json_str = match.group()
-                        json_obj = clean_json_string(json_str, return_dict=True)
-                        if json_obj != {} and is_valid_json_obj(json_obj, required_fields):
-                            json_objects.append(json_obj)
-                            logger.debug("Extracted valid JSON from text content")
-                        else:
-                            logger.debug(
-                                "JSON from text content lacks required fields or has empty values"
-                            )
-                    except json.JSONDecodeError:
-                        continue
+                found = find_valid_json(TEXT_JSON_RE, text, required_fields, "text content")
+                if found:
+                    json_objects.extend(found)
+                    logger.debug(f"Extracted {len(found)} valid JSON objects from text content")
 
     # If we still have no JSON, attempt to construct one from the page content
     if not json_objects:
@@ -221,4 +218,5 @@ def main(
 
 
 if __name__ == "__main__":
+    configure_logging()
     app()
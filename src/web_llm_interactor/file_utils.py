@@ -4,6 +4,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 import datetime
 import re
+from functools import lru_cache
 
 
 def safe_filename(s:str):
@@ -54,9 +55,11 @@ def load_text_file(file_path):
         raise
 
 
+@lru_cache(maxsize=None)
 def get_project_root(marker_file=".git"):
     """
     Find the project root directory by looking for a marker file.
+    The result is cached per marker file, so the filesystem is walked once.
 
     Args:
         marker_file (str): File/directory to look for (default: ".git")
@@ -9,6 +9,10 @@ from json_repair import repair_json
 from loguru import logger
 
 
+_JSON_DECODER = json.JSONDecoder()
+_JSON_SPAN_RE = re.compile("(\\[.*\\]|\\{.*\\})", re.DOTALL)
+
+
 class PathEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Path):
@@ -84,8 +88,10 @@ def save_json_to_file(data, file_path):
         logger.error(f"Failed to create directory {directory}: {e}")
         raise
     try:
+        # Serialize up front so the file gets one write instead of one per chunk
+        content = json.dumps(data, indent=4)
         with open(file_path, "w") as f:
-            json.dump(data, f, indent=4)
+            f.write(content)
             logger.info(f"Saved extracted tables to JSON cache at: {file_path}")
     except Exception as e:
         logger.error(f"Failed to save cache to {file_path}: {e}")
@@ -96,6 +102,12 @@ def parse_json(content: str, logger=None) -> Union[dict, list, str]:
     """
     Attempt to parse a JSON string directly, and if that fails, try repairing it.
 
+    If the content is not pure JSON, the first complete JSON value starting at the
+    first '{' or '[' is returned and any trailing text is ignored. Only that first
+    value is returned, even if more objects follow, and a bracket in leading prose
+    (e.g. "See [1] ...") is taken as the start of that value. Content with no
+    complete value falls back to a regex span plus json_repair.
+
     Args:
     content (str): The input JSON string to parse.
 
@@ -108,8 +120,17 @@ def parse_json(content: str, logger=None) -> Union[dict, list, str]:
         return parsed_content
     except json.JSONDecodeError as e:
         logger.warning(f"Direct JSON parsing failed: {e}")
+    # Parse the first complete object/array in place; trailing text (even with braces) is ignored
+    starts = [i for i in (content.find("{"), content.find("[")) if i != -1]
+    if starts:
+        try:
+            parsed_content, _ = _JSON_DECODER.raw_decode(content, min(starts))
+            logger.debug("Successfully parsed embedded JSON response")
+            return parsed_content
+        except json.JSONDecodeError:
+            pass
     try:
-        json_match = re.search("(\\[.*\\]|\\{.*\\})", content, re.DOTALL)
+        json_match = _JSON_SPAN_RE.search(content)
         if json_match:
             content = json_match.group(1)
         repaired_json = repair_json(content, return_objects=True)
@@ -228,6 +249,7 @@ def usage_example():
     example_escaped_characters = '{"text": "He said, \\"Hello, World!\\""}'
     example_large_json = json.dumps([{"index": i, "value": i * 2} for i in range(1000)])
     example_partial_json = '{"name": "John", "age": 30, "city":'
+    example_trailing_prose = 'Answer: {"name": "John"} Note: {braces} in prose are ignored.'
     print("Valid JSON String (return dict):")
     print(clean_json_string(example_json_str, return_dict=True))
     print("\nInvalid JSON String (return dict):")
@@ -244,6 +266,8 @@ def usage_example():
     print(clean_json_string(example_escaped_characters, return_dict=True))
     print("\nPartial JSON (return dict):")
     print(clean_json_string(example_partial_json, return_dict=True))
+    print("\nJSON followed by prose with braces (return dict, first value only):")
+    print(clean_json_string(example_trailing_prose, return_dict=True))
 
 
 if __name__ == "__main__":
@@ -3,21 +3,41 @@ import time
 import webbrowser
 import os
 import logging
+import re
 from pathlib import Path
 from random import uniform
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-    handlers=[logging.FileHandler("pyautogui_test.log"), logging.StreamHandler()],
-)
 logger = logging.getLogger(__name__)
 
 # PyAutoGUI settings
 pyautogui.PAUSE = 0.3  # Delay between actions
 pyautogui.FAILSAFE = True  # Move mouse to top-left to abort
 
+# Bot detection indicators, matched case-insensitively in one scan
+DETECTION_INDICATORS = [
+    "captcha",
+    "i'm not a robot",
+    "cloudflare",
+    "verify you are human",
+    "access denied",
+    "blocked",
+    "forbidden",
+    "security check",
+    "rate limit",
+]
+DETECTION_RE = re.compile(
+    "|".join(map(re.escape, DETECTION_INDICATORS)), re.IGNORECASE
+)
+
+
+def configure_logging():
+    """Log to pyautogui_test.log and the console."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s",
+        handlers=[logging.FileHandler("pyautogui_test.log"), logging.StreamHandler()],
+    )
+
 
 def mimic_human_typing(text):
     """Type text with randomized delays to mimic human typing."""
@@ -29,18 +49,7 @@ def mimic_human_typing(text):
 
 def check_for_detection(html_content):
     """Check HTML for bot detection indicators."""
-    indicators = [
-        "captcha",
-        "i'm not a robot",
-        "cloudflare",
-        "verify you are human",
-        "access denied",
-        "blocked",
-        "forbidden",
-        "security check",
-        "rate limit",
-    ]
-    return any(indicator in html_content.lower() for indicator in indicators)
+    return DETECTION_RE.search(html_content) is not None
 
 
 def get_input_coordinates():
@@ -176,4 +185,5 @@ def main():
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -0,0 +1,34 @@
+import unittest
+
+from web_llm_interactor.json_utils import clean_json_string
+
+
+class TestCleanJsonString(unittest.TestCase):
+    """
+    Tests for how clean_json_string picks the JSON value out of surrounding text.
+    parse_json returns the first complete JSON value and ignores what follows it.
+    """
+
+    def test_valid_json(self):
+        """A plain JSON string parses directly."""
+        result = clean_json_string('{"name": "John", "age": 30}', return_dict=True)
+        self.assertEqual(result, {"name": "John", "age": 30})
+
+    def test_multiple_objects_return_first(self):
+        """Only the first of several top-level objects is returned."""
+        result = clean_json_string('{"a":1} {"b":2}', return_dict=True)
+        self.assertEqual(result, {"a": 1})
+
+    def test_trailing_prose_with_braces(self):
+        """Braces in prose after the JSON value are ignored."""
+        result = clean_json_string('Answer: {"a": 1} Note: {braces}', return_dict=True)
+        self.assertEqual(result, {"a": 1})
+
+    def test_leading_bracket_starts_value(self):
+        """A bracket in prose before the object is parsed as the first value."""
+        result = clean_json_string('See [1] then {"a": 1}', return_dict=True)
+        self.assertEqual(result, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()